@@ -1,31 +1,54 @@
 import math
-import random
 import numpy as np
 
 from paratemp import ParallelTempering
 
+# numba is optional: without it the kernels below run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+STEP_SIZE = 0.5
+
 # defining 1 D energy function
+@njit(cache=True)
 def energy_fn(x: float) -> float:
     return float((x*x - 1.0) ** 2)
 
-# single temperature local monte carlo move -> it returns new state and new energy
-def local_step_fn(state: float, beta: float, rng: random.Random):
-    
-    x = state
-    E_x = energy_fn(x)
+# one Metropolis move with the random numbers drawn outside (so numba can compile it)
+@njit(cache=True)
+def metropolis_move(x: float, beta: float, u_normal: float, u_uniform: float):
 
-    step_size = 0.5
-    proposal = x + rng.normalvariate(0.0, step_size)
+    E_x = energy_fn(x)
+    proposal = x + STEP_SIZE * u_normal
     E_prop = energy_fn(proposal)
 
     # acceptance rule
-    delta = beta * (E_prop - E_x)
-    A = min(1,math.exp(-beta * delta))
-
-    if A==1.0 or rng.random() < A:
+    delta = E_prop - E_x
+    if delta <= 0.0 or u_uniform < math.exp(-beta * delta):
         return proposal, E_prop
-    else:
-        return x, E_x
+    return x, E_x
+
+# single temperature local monte carlo move -> it returns new state and new energy
+def local_step_fn(state: float, beta: float, rng: np.random.Generator):
+    return metropolis_move(state, beta, rng.standard_normal(), rng.random())
+
+
+@njit(cache=True)
+def _batch_kernel(x, beta, normals, uniforms):
+    new_x = np.empty_like(x)
+    new_E = np.empty_like(x)
+    for k in range(x.size):
+        new_x[k], new_E[k] = metropolis_move(x[k], beta[k], normals[k], uniforms[k])
+    return new_x, new_E
+
+# same move as local_step_fn, but for all replicas at once (x and beta have shape (M,))
+def batch_step_fn(x: np.ndarray, beta: np.ndarray, rng: np.random.Generator):
+    return _batch_kernel(x, beta, rng.standard_normal(x.size), rng.random(x.size))
 
 
 def main():
@@ -36,26 +59,27 @@ def main():
     n_replicas = 8
 
     init_state = 0.0
-    rng = random.Random(42)
+    rng = np.random.default_rng(42)
 
     pt = ParallelTempering(
         energy_fn=energy_fn,
         local_step_fn=local_step_fn,
+        batch_step_fn=batch_step_fn,
         T_min=T_min,
         T_max=T_max,
         n_replicas=n_replicas,
         ladder="geometric",
-        distribution="boltzmann",  
+        distribution="boltzmann",
         init_state=init_state,
         rng=rng,
     )
 
-    # we will store the values of the lowest temperature 
+    # we will store the values of the lowest temperature
     samples_lowT = []
 
     # it prints overall acceptance rate after each swapping period
-    def cb(it, replicas, sampler):
-        samples_lowT.append(float(replicas[0].state))
+    def cb(it, sampler):
+        samples_lowT.append(float(sampler.states[0]))
         if (it + 1) % 200 == 0:
             print(
                 f"Iter {it+1:5d} | "
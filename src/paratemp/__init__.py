@@ -11,16 +11,20 @@ from .core import (
     ParallelTempering,
     Replica,
     geometric_temperatures,
+    BaseDistribution,
     BoltzmannDistribution,
     TsallisDistribution,
+    GeneratorRandom,
 )
 
 __all__ = [
     "ParallelTempering",
     "Replica",
     "geometric_temperatures",
+    "BaseDistribution",
     "BoltzmannDistribution",
     "TsallisDistribution",
+    "GeneratorRandom",
 ]
 
 __version__ = "0.1.0"
@@ -1,21 +1,38 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, Dict
-import math
+import functools
+import inspect
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, Dict, Union
+import multiprocessing.pool
+import pickle
 import random
+import types
+import warnings
+import weakref
+
+import numpy as np
 
 
 # -------------------------------------------------------------------
 # Type aliases
+# 0. RNG: either a stdlib or a numpy random number generator
 # 1. EnergyFn: it takes a state and returns a float energy
 # 2.  it takes state, beta, rng and returns new state and new energy (this is the single-temperature MCMC step)
-# 3. function called after each PT iteration
+# 3. it takes the states and betas of all replicas as arrays plus a numpy Generator and returns new states and energies
+# 4. function called after each PT iteration, either callback(it, sampler) or callback(it, replicas, sampler)
 # -------------------------------------------------------------------
 
+RNG = Union[random.Random, np.random.Generator]
 EnergyFn = Callable[[Any], float]
 LocalStepFn = Callable[[Any, float, random.Random], Tuple[Any, float]]
-CallbackFn = Callable[[int, List["Replica"], "ParallelTempering"], None]
+BatchStepFn = Callable[
+    [np.ndarray, np.ndarray, np.random.Generator], Tuple[np.ndarray, np.ndarray]
+]
+CallbackFn = Union[
+    Callable[[int, "ParallelTempering"], None],
+    Callable[[int, List["Replica"], "ParallelTempering"], None],
+]
 
 
 # -------------------------------------------------------------------
@@ -27,7 +44,9 @@ class BaseDistribution:
     def log_weight(self, energy: float, beta: float) -> float:
         """
         Return log π(x) up to an additive constant.
-        Must be implemented by subclasses.
+        Must be implemented by subclasses, and must broadcast over NumPy
+        arrays of energies and betas (swaps are evaluated for many pairs
+        at once).
         """
         raise NotImplementedError
 
@@ -58,12 +77,115 @@ class TsallisDistribution(BaseDistribution):
             )
         self.q = q
 
-    def log_weight(self, energy: float, beta: float) -> float:
-        base = 1.0 - (1.0 - self.q) * beta * energy
-        if base <= 0.0:
-            # Outside the support → zero probability → log π = -∞
-            return float("-inf")
-        return math.log(base) / (1.0 - self.q)
+    def log_weight(self, energy: Any, beta: Any) -> Any:
+        base = 1.0 - (1.0 - self.q) * np.asarray(beta) * np.asarray(energy)
+        # Outside the support (base <= 0) → zero probability → log π = -∞
+        log_w = np.where(
+            base > 0.0,
+            np.log(np.maximum(base, 1e-300)) / (1.0 - self.q),
+            -np.inf,
+        )
+        return float(log_w) if log_w.ndim == 0 else log_w
+
+
+# -------------------------------------------------------------------
+# Fused kernel (jit=True)
+# -------------------------------------------------------------------
+
+# swap scheme codes understood by _pt_kernel
+_KERNEL_SCHEMES = {"all": 0, "even-odd": 1, "even-odd-random": 2}
+
+
+def _pt_kernel(
+    energy_fn, states, energies, betas, dbeta, n_iter, n_local, step_size,
+    scheme, parity, seed, pair_attempts, pair_accepted, out_lowT,
+):
+    """
+    Run `n_iter` full PT iterations on scalar float states, compiled with
+    numba: Gaussian random-walk Metropolis local moves followed by
+    Boltzmann neighbor swaps. Arrays are updated in place, the low-T state
+    after each iteration goes to out_lowT. Returns the new even/odd parity.
+    """
+    np.random.seed(seed)
+    M = states.shape[0]
+    for it in range(n_iter):
+        for k in range(M):
+            x = states[k]
+            E = energies[k]
+            beta = betas[k]
+            for _ in range(n_local):
+                prop = x + step_size * np.random.standard_normal()
+                E_prop = energy_fn(prop)
+                dE = E_prop - E
+                if dE <= 0.0 or np.random.random() < np.exp(-beta * dE):
+                    x = prop
+                    E = E_prop
+            states[k] = x
+            energies[k] = E
+
+        # "all" = even half-sweep then odd half-sweep, as in attempt_swaps
+        if scheme == 0:
+            first, n_halves = 0, 2
+        elif scheme == 1:
+            first, n_halves = parity, 1
+            parity ^= 1
+        else:
+            first, n_halves = (0 if np.random.random() < 0.5 else 1), 1
+        for h in range(n_halves):
+            for k in range(first + h, M - 1, 2):
+                log_A = dbeta[k] * (energies[k + 1] - energies[k])
+                pair_attempts[k] += 1
+                if log_A >= 0.0 or np.log(np.random.random()) < log_A:
+                    states[k], states[k + 1] = states[k + 1], states[k]
+                    energies[k], energies[k + 1] = energies[k + 1], energies[k]
+                    pair_accepted[k] += 1
+
+        out_lowT[it] = states[0]
+    return parity
+
+
+_pt_kernel_jit = None
+# numba dispatcher for each live energy_fn; the kernel is specialized on the
+# dispatcher's type, so reusing it avoids recompiling for every sampler
+_jit_energy_fns: "weakref.WeakKeyDictionary[Callable[[Any], float], Any]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _jit_compiled(energy_fn: EnergyFn) -> Any:
+    """
+    numba dispatcher for `energy_fn`, shared by all samplers while
+    `energy_fn` is alive. Raises TypeError if it is not a plain function.
+    """
+    import numba
+
+    jit_energy_fn = _jit_energy_fns.get(energy_fn)
+    if jit_energy_fn is None:
+        fn = energy_fn
+        if isinstance(energy_fn, types.FunctionType):
+            # compile a copy: the dispatcher holds on to its function, which
+            # would otherwise keep the weak key (and the entry) alive forever
+            fn = types.FunctionType(
+                energy_fn.__code__, energy_fn.__globals__, energy_fn.__name__,
+                energy_fn.__defaults__, energy_fn.__closure__,
+            )
+            fn.__qualname__ = energy_fn.__qualname__
+        jit_energy_fn = numba.njit(fn)
+        _jit_energy_fns[energy_fn] = jit_energy_fn
+    return jit_energy_fn
+
+
+def _compiled_pt_kernel():
+    """
+    numba-compiled `_pt_kernel`, built on first use so that importing
+    paratemp does not import numba.
+    """
+    global _pt_kernel_jit
+    if _pt_kernel_jit is None:
+        import numba
+
+        _pt_kernel_jit = numba.njit(_pt_kernel)
+    return _pt_kernel_jit
 
 
 # -------------------------------------------------------------------
@@ -78,12 +200,156 @@ class Replica:
     Attributes: state, energy, beta (inverse temperature), index (index of this replica in the ladder)
     """
 
+    __slots__ = ("state", "energy", "beta", "index")
+
     state: Any
     energy: float
     beta: float
     index: int
 
 
+def _takes_sampler_only(callback: CallbackFn) -> bool:
+    """
+    True if `callback` has the two-argument form callback(it, sampler).
+
+    Only positional parameters without a default count, so extra optional
+    parameters do not change the form; `*args`, or a second parameter named
+    `replicas` (as in callback(it, replicas, sampler=None)), means the
+    three-argument form.
+    """
+    try:
+        params = list(inspect.signature(callback).parameters.values())
+    except (TypeError, ValueError):
+        return False
+    if len(params) > 1 and params[1].name == "replicas":
+        return False
+    positional = 0
+    for param in params:
+        if param.kind == inspect.Parameter.VAR_POSITIONAL:
+            return False
+        if param.kind in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        ) and param.default is inspect.Parameter.empty:
+            positional += 1
+    return positional == 2
+
+
+# -------------------------------------------------------------------
+# Random number generation
+# -------------------------------------------------------------------
+
+class GeneratorRandom:
+    """
+    Wrap a numpy Generator so `local_step_fn` can use the scalar
+    `random.Random` methods on it.
+
+    random(), uniform(), gauss() / normalvariate() and randrange() return
+    Python scalars; every other attribute (standard_normal, integers, ...)
+    is forwarded to the Generator.
+    """
+
+    def __init__(self, generator: np.random.Generator) -> None:
+        self.generator = generator
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "generator":
+            # not set yet (e.g. while unpickling)
+            raise AttributeError(name)
+        return getattr(self.generator, name)
+
+    def random(self, size: Any = None) -> Any:
+        return self.generator.random(size)
+
+    def uniform(self, a: float = 0.0, b: float = 1.0, size: Any = None) -> Any:
+        return self.generator.uniform(a, b, size)
+
+    def gauss(self, mu: float = 0.0, sigma: float = 1.0) -> float:
+        return mu + sigma * self.generator.standard_normal()
+
+    normalvariate = gauss
+
+    def randrange(self, start: int, stop: Optional[int] = None) -> int:
+        if stop is None:
+            start, stop = 0, start
+        return int(self.generator.integers(start, stop))
+
+
+# -------------------------------------------------------------------
+# Process-pool worker
+# -------------------------------------------------------------------
+
+def _local_steps_worker(
+    args: Tuple[LocalStepFn, Any, float, int, int, bool],
+) -> Tuple[Any, float]:
+    """
+    Run `n_steps` local moves on one replica inside a worker process.
+
+    Each task gets its own RNG seeded by the parent, so no RNG state is
+    shared between processes.
+    """
+    local_step_fn, state, beta, seed, n_steps, use_numpy = args
+    rng: Any = random.Random(seed)
+    if use_numpy:
+        rng = GeneratorRandom(np.random.default_rng(seed))
+    energy = float("nan")
+    for _ in range(n_steps):
+        state, energy = local_step_fn(state, beta, rng)
+    return state, energy
+
+
+def _state_array(states: Sequence[Any]) -> np.ndarray:
+    """
+    Pack replica states into one array.
+
+    Float scalars and float arrays of a common shape D give a contiguous
+    float array of shape (M,) + D, so swaps are plain memory copies. Any
+    other states (ints, tuples, custom objects, ragged arrays) are kept
+    as references in an object array of shape (M,).
+    """
+    if all(isinstance(s, (float, np.floating, np.ndarray)) for s in states):
+        try:
+            arr = np.array(states)
+        except ValueError:
+            # ragged shapes
+            arr = None
+        if arr is not None and arr.dtype.kind == "f":
+            return arr
+
+    arr = np.empty(len(states), dtype=object)
+    for idx, state in enumerate(states):
+        arr[idx] = state
+    return arr
+
+
+def _restore_state_type(state: Any, template: Any) -> Any:
+    """
+    Convert one row of a batched state array back to the type of
+    `template`: tuples and lists of Python scalars, or a Python scalar.
+    """
+    if isinstance(template, np.ndarray):
+        return state
+    if not isinstance(state, (np.ndarray, np.generic)):
+        return state
+    value = state.tolist()
+    if isinstance(template, tuple):
+        return tuple(value)
+    return value
+
+
+# left/right slots of a set of disjoint neighbour pairs, as slices and index arrays
+_PairSet = Tuple[slice, slice, np.ndarray, np.ndarray]
+
+
+def _pair_set(first: int, M: int) -> _PairSet:
+    """
+    The neighbour pairs (first, first + 1), (first + 2, first + 3), ...
+    of a ladder with M slots.
+    """
+    i_arr = np.arange(first, M - 1, 2)
+    return slice(first, M - 1, 2), slice(first + 1, M, 2), i_arr, i_arr + 1
+
+
 # -------------------------------------------------------------------
 # Temperature ladder helpers
 # -------------------------------------------------------------------
@@ -140,16 +406,60 @@ class ParallelTempering:
     ladder : {"geometric"}, optional
         Method to construct temperatures if `temperatures` is None.
         For now we support only "geometric".
-    distribution : {"boltzmann", "tsallis"}, optional
-        Probability distribution type. Default: "boltzmann".
+    distribution : {"boltzmann", "tsallis"} or BaseDistribution, optional
+        Probability distribution type, or an instance of a custom
+        `BaseDistribution` subclass. Default: "boltzmann".
     tsallis_q : float, optional
         q parameter for Tsallis distribution. Only used if distribution="tsallis".
     init_state : Any, optional
         Single initial state to copy across all replicas.
     init_states : Sequence[Any], optional
         List of initial states, one per replica. Overrides init_state if given.
-    rng : random.Random, optional
-        Random number generator. If None, a new RNG with default seed is used.
+        Float scalars or float arrays of one shape are stored in a single
+        float array `states` of shape (M,) + state shape; anything else is
+        kept in an object array. With array states, `local_step_fn` gets
+        a view of the replica's row and should return a new array rather
+        than modify it in place.
+    rng : random.Random or numpy.random.Generator, optional
+        Random number generator. If None, a new `random.Random` is used.
+        Batched draws (swap acceptance, `batch_step_fn`) always come from a
+        numpy Generator: `rng` itself, or one seeded from `rng`. When `rng`
+        is a Generator, `local_step_fn` receives it wrapped in
+        `GeneratorRandom`, so both `rng.random()` and `rng.standard_normal()`
+        style calls work.
+    batch_step_fn : callable, optional
+        batch_step_fn(states, betas, rng) -> (new_states, new_energies)
+        Vectorized alternative to `local_step_fn` that advances all
+        replicas at once; `betas` has shape (M,) and `states` has shape
+        (M,) for scalar states or (M, D) for vector/sequence states, whose
+        rows are written back to the replicas. Rows of non-float states are
+        converted back to the original type (tuple, list or Python scalar).
+        When given, `step_local` uses it instead of `local_step_fn`.
+    n_workers : int, optional
+        Number of worker processes for the local moves. If > 1, a persistent
+        process pool runs each replica's `n_local_steps` as one task per
+        iteration; `local_step_fn` and the states must be picklable.
+        Use `close()` (or a `with` block) to shut the pool down.
+        Default: None (serial).
+    cache_energy : bool, optional
+        Memoize `energy_fn` with `functools.lru_cache`. Useful for discrete
+        state spaces (spins, bit vectors) where states are revisited often.
+        States must be hashable. The cached function is `self.energy_fn`,
+        so `local_step_fn` can call it too. Default: False.
+    cache_size : int, optional
+        Maximum number of cached energies (e.g. 2**N for N binary
+        variables). None means unbounded. Default: 2**16.
+    jit : bool, optional
+        Run whole iterations in one numba-compiled kernel (`numba` must be
+        installed). The kernel uses its own Gaussian random-walk Metropolis
+        move with `jit_step_size` instead of `local_step_fn`, and needs
+        the Boltzmann distribution, float scalar states and an `energy_fn`
+        that numba can compile. Otherwise a warning is issued and the
+        Python path is used. With an active kernel, `batch_step_fn` and
+        `n_workers` are ignored (with a warning). The low-T state of each iteration of the last
+        `run` is stored in `lowT_trace`. Default: False.
+    jit_step_size : float, optional
+        Proposal standard deviation of the jit kernel. Default: 0.5.
     """
 
     def __init__(
@@ -161,24 +471,42 @@ class ParallelTempering:
         T_max: Optional[float] = None,
         n_replicas: int = 8,
         ladder: str = "geometric",
-        distribution: str = "boltzmann",
+        distribution: Union[str, BaseDistribution] = "boltzmann",
         tsallis_q: float = 1.2,
         init_state: Optional[Any] = None,
         init_states: Optional[Sequence[Any]] = None,
-        rng: Optional[random.Random] = None,
+        rng: Optional[RNG] = None,
+        batch_step_fn: Optional[BatchStepFn] = None,
+        n_workers: Optional[int] = None,
+        cache_energy: bool = False,
+        cache_size: Optional[int] = 2**16,
+        jit: bool = False,
+        jit_step_size: float = 0.5,
     ) -> None:
         # ----------------------------
         # Store core callables and RNG
         # ----------------------------
+        if cache_energy:
+            energy_fn = functools.lru_cache(maxsize=cache_size)(energy_fn)
         self.energy_fn: EnergyFn = energy_fn
         self.local_step_fn: LocalStepFn = local_step_fn
-        self.rng: random.Random = rng or random.Random()
+        self.batch_step_fn: Optional[BatchStepFn] = batch_step_fn
+        self.rng: RNG = rng or random.Random()
+        # Generator for bulk draws, and the RNG object handed to local_step_fn
+        if isinstance(self.rng, np.random.Generator):
+            self._np_rng: np.random.Generator = self.rng
+            self._step_rng: Any = GeneratorRandom(self.rng)
+        else:
+            self._np_rng = np.random.default_rng(self.rng.getrandbits(64))
+            self._step_rng = self.rng
 
         # ----------------------------
         # Choose distribution model
         # ----------------------------
-        if distribution.lower() == "boltzmann":
-            self.distribution: BaseDistribution = BoltzmannDistribution()
+        if isinstance(distribution, BaseDistribution):
+            self.distribution: BaseDistribution = distribution
+        elif distribution.lower() == "boltzmann":
+            self.distribution = BoltzmannDistribution()
         elif distribution.lower() == "tsallis":
             self.distribution = TsallisDistribution(q=tsallis_q)
         else:
@@ -186,6 +514,10 @@ class ParallelTempering:
                 f"Unknown distribution '{distribution}'. "
                 "Supported: 'boltzmann', 'tsallis'."
             )
+        # Boltzmann swaps have a closed-form acceptance, see _attempt_swap_pairs
+        self._boltzmann: bool = isinstance(self.distribution, BoltzmannDistribution)
+        # Bound once so the generic swap path makes a single direct call
+        self._log_weight_fn: Callable[[float, float], float] = self.distribution.log_weight
 
         # ----------------------------
         # Build temperature ladder
@@ -204,10 +536,14 @@ class ParallelTempering:
             else:
                 raise ValueError(f"Unsupported ladder type: '{ladder}'")
 
-        # Sort temperatures ascending for clarity:
-        temps = sorted(temps)
-        self.temperatures: List[float] = temps
-        self.betas: List[float] = [1.0 / T for T in temps]
+        # Sort temperatures ascending for clarity (O(M) check, sort only if needed):
+        temps_arr = np.asarray(temps, dtype=np.float64)
+        if not np.all(temps_arr > 0.0):
+            raise ValueError("Temperatures must be positive.")
+        if not np.all(np.diff(temps_arr) >= 0.0):
+            temps_arr = np.sort(temps_arr)
+        self.temperatures: List[float] = temps_arr.tolist()
+        self.betas: np.ndarray = 1.0 / temps_arr
 
         M = len(self.temperatures)
 
@@ -227,18 +563,88 @@ class ParallelTempering:
                 )
             states = [init_state for _ in range(M)]
 
-        self.replicas: List[Replica] = []
-        for idx, (state, beta) in enumerate(zip(states, self.betas)):
-            energy = self.energy_fn(state)
-            self.replicas.append(Replica(state=state, energy=energy, beta=beta, index=idx))
+        # Replicas are stored as parallel arrays (structure of arrays):
+        # slot k holds states[k] / energies[k] at inverse temperature betas[k].
+        self.states: np.ndarray = _state_array(states)
+        self.energies: np.ndarray = np.array(
+            [self.energy_fn(state) for state in states], dtype=np.float64
+        )
+        self.index: np.ndarray = np.arange(M)
+        # Replica objects handed out by the `replicas` property, reused across calls
+        self._replica_views: Optional[List[Replica]] = None
 
         # ----------------------------
         # Swap statistics
         # ----------------------------
         self.n_swap_attempts: int = 0
         self.n_swaps_accepted: int = 0
-        # Per-pair statistics: key = (i, j), i<j
-        self.pair_stats: Dict[Tuple[int, int], Dict[str, int]] = {}
+        # Per-pair statistics for neighbour pairs (k, k+1), indexed by k
+        self._pair_attempts: np.ndarray = np.zeros(M - 1, dtype=np.int64)
+        self._pair_accepted: np.ndarray = np.zeros(M - 1, dtype=np.int64)
+
+        self._refresh_ladder_cache()
+        # Which set the deterministic "even-odd" scheme tries next (0 = even)
+        self._swap_parity: int = 0
+
+        # ----------------------------
+        # Optional fused numba kernel
+        # ----------------------------
+        self.jit_step_size: float = jit_step_size
+        self.lowT_trace: Optional[np.ndarray] = None
+        self._jit_energy_fn: Optional[Any] = None
+        if jit:
+            try:
+                import numba
+            except ImportError:
+                numba = None
+            if numba is None:
+                reason = "numba is not installed"
+            elif not self._boltzmann:
+                reason = "it only supports the Boltzmann distribution"
+            elif self.states.dtype != np.float64 or self.states.ndim != 1:
+                reason = "it only supports float scalar states"
+            else:
+                reason = None
+                if isinstance(energy_fn, numba.core.dispatcher.Dispatcher):
+                    self._jit_energy_fn = energy_fn
+                else:
+                    try:
+                        self._jit_energy_fn = _jit_compiled(energy_fn)
+                    except TypeError:
+                        # not a plain function (bound method, partial, lru_cache, ...)
+                        reason = "numba cannot compile energy_fn"
+            if reason is not None:
+                warnings.warn(f"jit=True ignored: {reason}.", RuntimeWarning, stacklevel=2)
+        use_workers = n_workers is not None and n_workers > 1
+        if self._jit_energy_fn is not None:
+            # the kernel runs its own local moves
+            for name, given in (("batch_step_fn", batch_step_fn is not None),
+                                ("n_workers", use_workers)):
+                if given:
+                    warnings.warn(
+                        f"{name} ignored: jit=True runs its own local moves.",
+                        RuntimeWarning,
+                        stacklevel=2,
+                    )
+            use_workers = False
+
+        # ----------------------------
+        # Optional worker pool for local moves
+        # (created last so a failed validation above cannot leak it)
+        # ----------------------------
+        self._pool: Optional[multiprocessing.pool.Pool] = None
+        if use_workers and batch_step_fn is None:
+            try:
+                pickle.dumps(local_step_fn)
+            except Exception:
+                # Not shippable to workers (lambda, closure, ...): stay serial
+                warnings.warn(
+                    "n_workers ignored: local_step_fn cannot be pickled.",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+            else:
+                self._pool = multiprocessing.Pool(n_workers)
 
     # ------------------------------------------------------------------
     # Properties & helpers
@@ -246,7 +652,58 @@ class ParallelTempering:
 
     @property
     def n_replicas(self) -> int:
-        return len(self.replicas)
+        return len(self.betas)
+
+    @property
+    def replicas(self) -> List[Replica]:
+        """
+        The ensemble as a list of `Replica` objects.
+
+        The objects are created once and refreshed in place from the
+        `states`, `energies` and `betas` arrays on every access; modifying
+        them does not affect the sampler. Vector states are copied out of
+        the (M, D) `states` array, so they stay valid after later steps.
+        """
+        views = self._replica_views
+        if views is None:
+            views = [
+                Replica(state=None, energy=0.0, beta=0.0, index=k)
+                for k in range(self.n_replicas)
+            ]
+            self._replica_views = views
+        # rows of an (M, D) array are views that swaps would overwrite
+        copy_rows = self.states.ndim > 1
+        for rep, state, energy, beta in zip(
+            views, self._state_list(), self.energies.tolist(), self.betas.tolist()
+        ):
+            rep.state = state.copy() if copy_rows else state
+            rep.energy = energy
+            rep.beta = beta
+        return views
+
+    def close(self) -> None:
+        """
+        Shut down the worker pool, if any. The sampler falls back to
+        serial local moves afterwards.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self) -> "ParallelTempering":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def energy_cache_info(self) -> Optional[Any]:
+        """
+        Hit/miss statistics of the energy cache (see `functools.lru_cache`),
+        or None if `cache_energy` is off. Use it to tune `cache_size`.
+        """
+        cache_info = getattr(self.energy_fn, "cache_info", None)
+        return None if cache_info is None else cache_info()
 
     def swap_acceptance_rate(self) -> float:
         """
@@ -256,98 +713,199 @@ class ParallelTempering:
             return 0.0
         return self.n_swaps_accepted / self.n_swap_attempts
 
+    @property
+    def pair_stats(self) -> Dict[Tuple[int, int], Dict[str, int]]:
+        """
+        Swap counts for each attempted neighbor pair (i, j), i<j.
+        Returns a dict: {(i, j): {"attempts": n, "accepted": n}}
+        """
+        return {
+            (k, k + 1): {"attempts": att, "accepted": acc}
+            for k, (att, acc) in enumerate(
+                zip(self._pair_attempts.tolist(), self._pair_accepted.tolist())
+            )
+            if att > 0
+        }
+
     def pair_acceptance_rates(self) -> Dict[Tuple[int, int], float]:
         """
-        Acceptance rate for each neighbor pair (i, j).
+        Acceptance rate for each attempted neighbor pair (i, j).
         Returns a dict: {(i, j): rate}
         """
-        rates: Dict[Tuple[int, int], float] = {}
-        for pair, stats in self.pair_stats.items():
-            att = stats.get("attempts", 0)
-            acc = stats.get("accepted", 0)
-            rates[pair] = 0.0 if att == 0 else acc / att
-        return rates
+        attempted = self._pair_attempts > 0
+        rates = np.divide(
+            self._pair_accepted,
+            self._pair_attempts,
+            out=np.zeros(len(self._pair_attempts)),
+            where=attempted,
+        ).tolist()
+        return {
+            (k, k + 1): rates[k] for k in np.flatnonzero(attempted).tolist()
+        }
+
+    def _state_list(self) -> List[Any]:
+        """
+        The states as a list: Python floats for scalar float states, rows
+        of the array for vector states, the stored objects otherwise.
+        """
+        if self.states.ndim == 1 and self.states.dtype != object:
+            return self.states.tolist()
+        return list(self.states)
+
+    def _store_states(self, states: Sequence[Any]) -> None:
+        """
+        Write a list of per-replica states back into `states`.
+        """
+        if self.states.dtype == object:
+            # element-wise, so sequence states are not unpacked into rows
+            for i, state in enumerate(states):
+                self.states[i] = state
+        else:
+            self.states[:] = states
+
+    def _refresh_ladder_cache(self) -> None:
+        """
+        Precompute the ladder-dependent arrays used by the swap step.
+        Must be called again whenever `betas` changes.
+        """
+        M = self.n_replicas
+        # β_{k+1} - β_k for each neighbour pair (k, k+1)
+        self._dbeta: np.ndarray = self.betas[1:] - self.betas[:-1]
+        # Left/right slots of the even (0,1), (2,3), ... and
+        # odd (1,2), (3,4), ... neighbour pairs: basic slices, read as views
+        # by the swap step, plus index arrays to pick out accepted pairs
+        self._even_pairs: _PairSet = _pair_set(0, M)
+        self._odd_pairs: _PairSet = _pair_set(1, M)
+
+    def _reset_swap_stats(self) -> None:
+        self.n_swap_attempts = 0
+        self.n_swaps_accepted = 0
+        self._pair_attempts[:] = 0
+        self._pair_accepted[:] = 0
 
     # ------------------------------------------------------------------
-    # Core PT operations
+    # Temperature ladder tuning
     # ------------------------------------------------------------------
 
-    def step_local(self, n_steps: int = 1) -> None:
+    def optimize_ladder(
+        self,
+        n_calibration_iters: int,
+        n_local_steps: int = 1,
+        n_rounds: int = 1,
+        rate: float = 1.0,
+    ) -> List[float]:
         """
-        Perform `n_steps` local MCMC moves on each replica independently.
+        Redistribute the intermediate temperatures from measured swap
+        rejection rates (feedback-optimized ladder).
 
-        """
-        for _ in range(n_steps):
-            for i, rep in enumerate(self.replicas):
-                new_state, new_energy = self.local_step_fn(
-                    rep.state, rep.beta, self.rng
-                )
-                # local_step_fn is responsible for accept/reject; we just store.
-                self.replicas[i].state = new_state
-                self.replicas[i].energy = new_energy
+        Each round runs `n_calibration_iters` iterations with all neighbor
+        pairs, estimates the communication barrier
+
+            Λ(β_k) = Σ_{l<k} r_l,   r_l = 1 - acceptance of pair (l, l+1)
 
-    def _log_weight(self, energy: float, beta: float) -> float:
-        return self.distribution.log_weight(energy, beta)
+        and moves the betas towards the ladder with equal barrier
+        Λ(β_k) = k Λ(β_{M-1}) / (M-1) between neighbors. T_min and T_max
+        stay pinned. Swap statistics are cleared after every round.
 
-    def _attempt_swap_pair(self, i: int, j: int) -> None:
+        Parameters
+        ----------
+        n_calibration_iters : int
+            Iterations per calibration round.
+        n_local_steps : int
+            Local MCMC steps per calibration iteration.
+        n_rounds : int
+            Number of calibrate/update rounds.
+        rate : float
+            Fraction of the step towards the new ladder taken each round
+            (1.0 jumps straight to it; smaller values damp the updates).
+
+        Returns
+        -------
+        List[float]
+            The new temperatures (ascending).
         """
-        Attempt a replica-exchange (swap) between replicas i and j.
+        if not 0.0 < rate <= 1.0:
+            raise ValueError("rate must be in (0, 1].")
 
-        Generic Metropolis–Hastings acceptance:
+        M = self.n_replicas
+        for _ in range(n_rounds):
+            self._reset_swap_stats()
+            self.run(n_calibration_iters, n_local_steps, swap_scheme="all")
 
-            A = min(1, [ π_i(x_j) π_j(x_i) ] / [ π_i(x_i) π_j(x_j) ])
+            accepted = self._pair_accepted / np.maximum(self._pair_attempts, 1)
+            # Keep Λ strictly increasing so it can be inverted by interpolation
+            r = np.maximum(1.0 - accepted, np.finfo(np.float64).eps)
+            barrier = np.concatenate(([0.0], np.cumsum(r)))
 
-        where π_k uses the distribution model (Boltzmann, Tsallis, etc.)
-        associated with replica k's β.
-        """
-        if i == j:
-            return
-        if not (0 <= i < self.n_replicas and 0 <= j < self.n_replicas):
-            return
+            targets = np.linspace(0.0, barrier[-1], M)
+            new_betas = np.interp(targets, barrier, self.betas)
+            new_betas[0], new_betas[-1] = self.betas[0], self.betas[-1]
 
-        rep_i = self.replicas[i]
-        rep_j = self.replicas[j]
+            self.betas = (1.0 - rate) * self.betas + rate * new_betas
+            self._refresh_ladder_cache()
 
-        beta_i, beta_j = rep_i.beta, rep_j.beta
-        E_i, E_j = rep_i.energy, rep_j.energy
+        self.temperatures = (1.0 / self.betas).tolist()
+        self._reset_swap_stats()
+        return self.temperatures
 
-        log_pi_xi = self._log_weight(E_i, beta_i)
-        log_pi_xj = self._log_weight(E_j, beta_i)
-        log_pj_xj = self._log_weight(E_j, beta_j)
-        log_pj_xi = self._log_weight(E_i, beta_j)
+    # ------------------------------------------------------------------
+    # Core PT operations
+    # ------------------------------------------------------------------
 
-        log_num = log_pi_xj + log_pj_xi
-        log_den = log_pi_xi + log_pj_xj
-        log_A = log_num - log_den
+    def step_local(self, n_steps: int = 1) -> None:
+        """
+        Perform `n_steps` local MCMC moves on each replica independently.
 
-        # A = exp(log_A), but clip at 1
-        A = 1.0 if log_A >= 0.0 else math.exp(log_A)
+        If a `batch_step_fn` was given, all replicas are advanced together
+        as arrays and written back once at the end.
+        """
+        if self.batch_step_fn is not None:
+            states = self.states
+            if states.dtype == object:
+                states = np.array(states.tolist())
+            energies = self.energies
+            for _ in range(n_steps):
+                states, energies = self.batch_step_fn(states, self.betas, self._np_rng)
+            if self.states.dtype == object:
+                # sequence states come back as rows of an (M, D) array
+                for i, state in enumerate(states):
+                    self.states[i] = _restore_state_type(state, self.states[i])
+            else:
+                self.states[:] = states
+            self.energies[:] = energies
+            return
 
-        # Update global stats
-        self.n_swap_attempts += 1
-        pair = (min(i, j), max(i, j))
-        stats = self.pair_stats.setdefault(pair, {"attempts": 0, "accepted": 0})
-        stats["attempts"] += 1
-
-        if self.rng.random() < A:
-            # Swap states *and* energies; betas stay with replicas i & j
-            new_rep_i = Replica(
-                state=rep_j.state,
-                energy=rep_j.energy,
-                beta=beta_i,
-                index=rep_i.index,
-            )
-            new_rep_j = Replica(
-                state=rep_i.state,
-                energy=rep_i.energy,
-                beta=beta_j,
-                index=rep_j.index,
-            )
-            self.replicas[i] = new_rep_i
-            self.replicas[j] = new_rep_j
+        if self._pool is not None:
+            if n_steps < 1:
+                return
+            use_numpy = isinstance(self.rng, np.random.Generator)
+            seeds = self._np_rng.integers(2**63, size=self.n_replicas).tolist()
+            tasks = [
+                (self.local_step_fn, state, beta, seed, n_steps, use_numpy)
+                for state, beta, seed in zip(
+                    self._state_list(), self.betas.tolist(), seeds
+                )
+            ]
+            results = self._pool.map(_local_steps_worker, tasks)
+            new_states, new_energies = zip(*results)
+            self._store_states(new_states)
+            self.energies[:] = new_energies
+            return
 
-            self.n_swaps_accepted += 1
-            stats["accepted"] += 1
+        if n_steps < 1:
+            return
+        # Loop over Python lists and write back once: element access on the
+        # arrays would dominate the cost of a cheap local_step_fn
+        states = self._state_list()
+        betas = self.betas.tolist()
+        energies = self.energies.tolist()
+        local_step_fn, rng = self.local_step_fn, self._step_rng
+        for _ in range(n_steps):
+            for i, beta in enumerate(betas):
+                # local_step_fn is responsible for accept/reject; we just store.
+                states[i], energies[i] = local_step_fn(states[i], beta, rng)
+        self._store_states(states)
+        self.energies[:] = energies
 
     def attempt_swaps(self, scheme: str = "even-odd") -> None:
         """
@@ -355,30 +913,110 @@ class ParallelTempering:
 
         Parameters
         ----------
-        scheme : {"even-odd", "all"}
-            'all'      – try all neighbor pairs (0,1), (1,2), ..., (M-2, M-1).
-            'even-odd' – on each call, randomly choose between:
-                          (0,1), (2,3), ...
-                       or (1,2), (3,4), ...
+        scheme : {"even-odd", "even-odd-random", "all"}
+            'all'             – try all neighbor pairs: first the even pairs
+                                (0,1), (2,3), ..., then the odd pairs
+                                (1,2), (3,4), ... with the updated states.
+            'even-odd'        – alternate deterministically between
+                                (0,1), (2,3), ...   (even calls)
+                                (1,2), (3,4), ...   (odd calls)
+                                i.e. non-reversible PT; no RNG draw.
+            'even-odd-random' – on each call, randomly choose between the
+                                even and the odd pairs.
         """
         M = self.n_replicas
         if M < 2:
             return
 
         if scheme == "all":
-            pairs = [(i, i + 1) for i in range(M - 1)]
+            # Neighbouring pairs overlap, so sweep in two disjoint halves
+            self._attempt_swap_pairs(self._even_pairs)
+            self._attempt_swap_pairs(self._odd_pairs)
+            return
         elif scheme == "even-odd":
+            if self._swap_parity == 0:
+                pairs = self._even_pairs
+            else:
+                pairs = self._odd_pairs
+            self._swap_parity ^= 1
+        elif scheme == "even-odd-random":
             if self.rng.random() < 0.5:
                 # even pairs: (0,1), (2,3), ...
-                pairs = [(i, i + 1) for i in range(0, M - 1, 2)]
+                pairs = self._even_pairs
             else:
                 # odd pairs: (1,2), (3,4), ...
-                pairs = [(i, i + 1) for i in range(1, M - 1, 2)]
+                pairs = self._odd_pairs
         else:
             raise ValueError(f"Unknown swap scheme: '{scheme}'")
 
-        for i, j in pairs:
-            self._attempt_swap_pair(i, j)
+        self._attempt_swap_pairs(pairs)
+
+    def _attempt_swap_pairs(self, pairs: _PairSet) -> None:
+        """
+        Attempt swaps for a set of disjoint neighbor pairs (i, i + 1) at
+        once; `pairs` holds the left and right slots (see `_pair_set`).
+
+        Generic Metropolis–Hastings acceptance:
+
+            A = min(1, [ π_i(x_j) π_j(x_i) ] / [ π_i(x_i) π_j(x_j) ])
+
+        where π_k uses the distribution model (Boltzmann, Tsallis, etc.)
+        associated with replica k's β. For Boltzmann this reduces to
+
+            log A = (β_i - β_j) (E_i - E_j)
+
+        Since the pairs share no replica, all acceptances are independent;
+        other distributions evaluate their (broadcasting) log_weight on all
+        pairs together. The array calls have a fixed cost of a few
+        microseconds per sweep, so this beats a per-pair Python loop from
+        about M = 10 replicas up (roughly 6x at M = 64) and is up to ~30%
+        slower for shorter ladders.
+        """
+        sl_i, sl_j, i_arr, j_arr = pairs
+        n_pairs = len(i_arr)
+        if n_pairs == 0:
+            return
+
+        E_i, E_j = self.energies[sl_i], self.energies[sl_j]
+        if self._boltzmann:
+            log_A = self._dbeta[sl_i] * (E_j - E_i)
+        else:
+            beta_i, beta_j = self.betas[sl_i], self.betas[sl_j]
+            log_weight = self._log_weight_fn
+            # -inf - (-inf) = nan (both states outside the support) → rejected
+            with np.errstate(invalid="ignore"):
+                log_A = (log_weight(E_j, beta_i) + log_weight(E_i, beta_j)) - (
+                    log_weight(E_i, beta_i) + log_weight(E_j, beta_j)
+                )
+            # Degenerate pairs: the swap leaves the joint density unchanged
+            log_A[(E_i == E_j) | (beta_i == beta_j)] = 0.0
+        # Only pairs with log A < 0 need a uniform draw
+        accept = log_A >= 0.0
+        pending = ~accept
+        n_pending = int(np.count_nonzero(pending))
+        if n_pending:
+            # 1 - u lies in (0, 1], so the log is always finite
+            log_u = np.log1p(-self._np_rng.random(n_pending))
+            accept[pending] = log_u < log_A[pending]
+
+        # Update global stats
+        n_accepted = int(np.count_nonzero(accept))
+        self.n_swap_attempts += n_pairs
+        self.n_swaps_accepted += n_accepted
+        self._pair_attempts[sl_i] += 1
+        if n_accepted == 0:
+            return
+
+        # Pairs in one sweep are disjoint, so each slot is hit at most once
+        i_acc, j_acc = i_arr[accept], j_arr[accept]
+        self._pair_accepted[i_acc] += 1
+
+        # Swap states *and* energies of the accepted pairs
+        self.states[i_acc], self.states[j_acc] = self.states[j_acc], self.states[i_acc]
+        self.energies[i_acc], self.energies[j_acc] = (
+            self.energies[j_acc],
+            self.energies[i_acc],
+        )
 
     def run(
         self,
@@ -386,6 +1024,7 @@ class ParallelTempering:
         n_local_steps: int = 1,
         swap_scheme: str = "all",
         callback: Optional[CallbackFn] = None,
+        callback_form: Optional[str] = None,
     ) -> None:
         """
         Run the parallel tempering simulation.
@@ -400,14 +1039,98 @@ class ParallelTempering:
             Number of outer iterations.
         n_local_steps : int
             Number of local MCMC steps per iteration per replica.
-        swap_scheme : {"even-odd", "all"}
-            Swap pattern for neighbor pairs.
+        swap_scheme : {"even-odd", "even-odd-random", "all"}
+            Swap pattern for neighbor pairs (see `attempt_swaps`).
         callback : callable, optional
-            Function called after each iteration:
+            Function called after each iteration, either
+                callback(iteration_index, sampler)
+            or
                 callback(iteration_index, replicas, sampler)
+            Unless `callback_form` says otherwise, the form is chosen from
+            the signature: a second parameter named `replicas` or `*args`
+            selects the three-argument form, otherwise the number of
+            positional parameters without a default decides.
+            The two-argument form is recommended: read the arrays directly
+            (e.g. `sampler.states[0]` for the lowest temperature) instead of
+            building `Replica` objects every iteration. For vector states
+            `sampler.states[k]` is a view into the sampler's array that later
+            iterations overwrite; copy it before storing it.
+            With jit=True, the kernel is then entered once per iteration
+            instead of once per run.
+        callback_form : {"sampler", "replicas"}, optional
+            Call `callback` as callback(it, sampler) or as
+            callback(it, replicas, sampler) regardless of its signature.
+            Default: None (inspect the signature).
         """
+        if callback_form not in (None, "sampler", "replicas"):
+            raise ValueError(f"Unknown callback form: '{callback_form}'")
+        notify: Optional[Callable[[int], None]] = None
+        if callback is not None:
+            if callback_form is None:
+                sampler_only = _takes_sampler_only(callback)
+            else:
+                sampler_only = callback_form == "sampler"
+            if sampler_only:
+                notify = lambda it: callback(it, self)
+            else:
+                notify = lambda it: callback(it, self.replicas, self)
+
+        if self._jit_energy_fn is not None and self._run_jit(
+            n_iterations, n_local_steps, swap_scheme, notify
+        ):
+            return
+
         for it in range(n_iterations):
             self.step_local(n_local_steps)
             self.attempt_swaps(scheme=swap_scheme)
-            if callback is not None:
-                callback(it, self.replicas, self)
+            if notify is not None:
+                notify(it)
+
+    def _run_jit(
+        self,
+        n_iterations: int,
+        n_local_steps: int,
+        swap_scheme: str,
+        notify: Optional[Callable[[int], None]],
+    ) -> bool:
+        """
+        Run the iterations in the compiled kernel. Returns False (and
+        disables jit) if `energy_fn` cannot be compiled.
+        """
+        from numba.core.errors import NumbaError
+
+        if swap_scheme not in _KERNEL_SCHEMES:
+            raise ValueError(f"Unknown swap scheme: '{swap_scheme}'")
+        scheme = _KERNEL_SCHEMES[swap_scheme]
+        self.lowT_trace = np.empty(n_iterations, dtype=np.float64)
+        attempts_before = int(self._pair_attempts.sum())
+        accepted_before = int(self._pair_accepted.sum())
+
+        # one kernel call per run, or per iteration if a callback needs control
+        block = max(n_iterations, 1) if notify is None else 1
+        for start in range(0, n_iterations, block):
+            n_iter = min(block, n_iterations - start)
+            try:
+                self._swap_parity = _compiled_pt_kernel()(
+                    self._jit_energy_fn, self.states, self.energies,
+                    self.betas, self._dbeta, n_iter, n_local_steps,
+                    self.jit_step_size, scheme, self._swap_parity,
+                    int(self._np_rng.integers(2**32)),
+                    self._pair_attempts, self._pair_accepted,
+                    self.lowT_trace[start:start + n_iter],
+                )
+            except NumbaError:
+                # compilation fails before the kernel touches any state
+                warnings.warn(
+                    "jit=True ignored: numba could not compile energy_fn.",
+                    RuntimeWarning,
+                )
+                self._jit_energy_fn = None
+                self.lowT_trace = None
+                return False
+            if notify is not None:
+                notify(start)
+
+        self.n_swap_attempts += int(self._pair_attempts.sum()) - attempts_before
+        self.n_swaps_accepted += int(self._pair_accepted.sum()) - accepted_before
+        return True
@@ -0,0 +1,479 @@
+import random
+
+import numpy as np
+import pytest
+
+from paratemp import BaseDistribution, GeneratorRandom, ParallelTempering
+from paratemp.core import _takes_sampler_only
+
+
+def flat_energy(x):
+    return 0.0
+
+
+def identity_step(x, beta, rng):
+    return x, 0.0
+
+
+@pytest.mark.parametrize("scheme", ["all", "even-odd", "even-odd-random"])
+@pytest.mark.parametrize(
+    "init_states",
+    [[0.0, 1.0, 2.0, 3.0, 4.0], [0, 1, 2, 3, 4]],
+    ids=["float", "object"],
+)
+def test_swaps_keep_states_a_permutation(scheme, init_states):
+    pt = ParallelTempering(
+        energy_fn=flat_energy,
+        local_step_fn=identity_step,
+        temperatures=[1.0, 2.0, 3.0, 4.0, 5.0],
+        init_states=init_states,
+        rng=np.random.default_rng(0),
+    )
+    for _ in range(20):
+        pt.attempt_swaps(scheme=scheme)
+        assert sorted(pt.states.tolist()) == sorted(init_states)
+
+
+def test_all_scheme_sweeps_even_then_odd_pairs():
+    pt = ParallelTempering(
+        energy_fn=flat_energy,
+        local_step_fn=identity_step,
+        temperatures=[1.0, 2.0, 3.0, 4.0, 5.0],
+        init_states=[0, 1, 2, 3, 4],
+    )
+    pt.attempt_swaps(scheme="all")
+    # flat energy: every swap is accepted
+    assert pt.states.tolist() == [1, 3, 0, 4, 2]
+    assert pt.pair_acceptance_rates() == {(k, k + 1): 1.0 for k in range(4)}
+
+
+def test_even_odd_scheme_alternates_without_drawing_from_rng():
+    rng = random.Random(0)
+    pt = ParallelTempering(
+        energy_fn=flat_energy,
+        local_step_fn=identity_step,
+        temperatures=[1.0, 2.0, 3.0, 4.0, 5.0],
+        init_states=[0, 1, 2, 3, 4],
+        rng=rng,
+    )
+    rng_state = rng.getstate()
+    even, odd = [(0, 1), (2, 3)], [(1, 2), (3, 4)]
+    for attempted in [even, odd, even, odd]:
+        before = {pair: stats["attempts"] for pair, stats in pt.pair_stats.items()}
+        pt.attempt_swaps(scheme="even-odd")
+        after = {pair: stats["attempts"] for pair, stats in pt.pair_stats.items()}
+        changed = sorted(p for p in after if after[p] != before.get(p, 0))
+        assert changed == attempted
+    assert rng.getstate() == rng_state
+
+
+def test_unpicklable_local_step_warns_and_runs_serially():
+    with pytest.warns(RuntimeWarning, match="n_workers ignored"):
+        pt = ParallelTempering(
+            energy_fn=flat_energy,
+            local_step_fn=lambda x, beta, rng: (x, 0.0),
+            temperatures=[1.0, 2.0],
+            init_state=0.0,
+            n_workers=2,
+        )
+    assert pt._pool is None
+    pt.run(3)
+
+
+def random_walk_step(x, beta, rng):
+    new_x = x + rng.gauss(0.0, 1.0)
+    return new_x, new_x
+
+
+def test_worker_pool_runs_local_moves_and_closes():
+    with ParallelTempering(
+        energy_fn=lambda x: x,
+        local_step_fn=random_walk_step,
+        temperatures=[1.0, 2.0, 3.0],
+        init_state=0.0,
+        n_workers=2,
+        rng=np.random.default_rng(0),
+    ) as pt:
+        assert pt._pool is not None
+        pt.step_local(3)
+        # independently seeded tasks give distinct walks
+        assert len(set(pt.states.tolist())) == 3
+        assert pt.energies.tolist() == pt.states.tolist()
+    assert pt._pool is None
+
+
+def shift_batch_step(states, betas, rng):
+    new_states = states + 1
+    return new_states, np.zeros(len(betas))
+
+
+@pytest.mark.parametrize(
+    "init_states, expected",
+    [
+        ([0.0, 1.0], [3.0, 4.0]),
+        ([np.zeros(2), np.ones(2)], [[3.0, 3.0], [4.0, 4.0]]),
+        ([(0, 0), (1, 1)], [(3, 3), (4, 4)]),
+    ],
+    ids=["float", "vector", "tuple"],
+)
+def test_batch_step_fn_writes_back_rows(init_states, expected):
+    pt = ParallelTempering(
+        energy_fn=lambda x: 1.0,
+        local_step_fn=identity_step,
+        batch_step_fn=shift_batch_step,
+        temperatures=[1.0, 2.0],
+        init_states=init_states,
+    )
+    pt.step_local(3)
+    assert pt.states.tolist() == expected
+    assert pt.energies.tolist() == [0.0, 0.0]
+    if isinstance(init_states[0], tuple):
+        assert all(type(v) is int for state in pt.states for v in state)
+
+
+def test_generator_random_returns_python_scalars():
+    rng = GeneratorRandom(np.random.default_rng(0))
+    assert type(rng.random()) is float
+    assert type(rng.gauss(1.0, 2.0)) is float
+    assert rng.random(3).shape == (3,)
+
+    draws = {rng.randrange(3) for _ in range(200)}
+    assert draws == {0, 1, 2}
+    draws = {rng.randrange(5, 7) for _ in range(200)}
+    assert draws == {5, 6}
+    assert all(type(v) is int for v in draws)
+
+
+def test_local_step_fn_gets_generator_random_for_numpy_rng():
+    seen = []
+
+    def step(x, beta, rng):
+        seen.append(rng)
+        return x, 0.0
+
+    pt = ParallelTempering(
+        energy_fn=flat_energy,
+        local_step_fn=step,
+        temperatures=[1.0, 2.0],
+        init_state=0.0,
+        rng=np.random.default_rng(0),
+    )
+    pt.step_local()
+    assert all(isinstance(rng, GeneratorRandom) for rng in seen)
+    assert seen[0].generator is pt.rng
+
+
+def test_cache_energy_hits_on_revisited_states():
+    pt = ParallelTempering(
+        energy_fn=lambda x: float(sum(x)),
+        local_step_fn=identity_step,
+        temperatures=[1.0, 2.0],
+        init_state=(1, 1),
+        cache_energy=True,
+    )
+    # both replicas start in the same state: one miss, then one hit
+    info = pt.energy_cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+    pt.energy_fn((1, 1))
+    pt.energy_fn((1, -1))
+    info = pt.energy_cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+
+
+def test_energy_cache_info_is_none_without_caching():
+    pt = ParallelTempering(
+        energy_fn=flat_energy,
+        local_step_fn=identity_step,
+        temperatures=[1.0, 2.0],
+        init_state=0.0,
+    )
+    assert pt.energy_cache_info() is None
+
+
+@pytest.mark.parametrize("distribution", ["boltzmann", "tsallis"])
+def test_swap_moves_low_energy_state_to_cold_replica(distribution):
+    # energy_fn is the identity: replica 0 (T=1) holds E=5, replica 1 (T=2) E=0
+    pt = ParallelTempering(
+        energy_fn=lambda x: x,
+        local_step_fn=identity_step,
+        temperatures=[1.0, 2.0],
+        init_states=[5.0, 0.0],
+        distribution=distribution,
+    )
+    pt.attempt_swaps(scheme="all")
+    assert pt.states.tolist() == [0.0, 5.0]
+
+
+class _ReversedBoltzmann(BaseDistribution):
+    # favours high energies, so the E=5 state moves to the cold replica
+    def log_weight(self, energy, beta):
+        return beta * np.asarray(energy)
+
+
+def test_custom_distribution_instance_is_used_for_swaps():
+    pt = ParallelTempering(
+        energy_fn=lambda x: x,
+        local_step_fn=identity_step,
+        temperatures=[1.0, 2.0],
+        init_states=[0.0, 5.0],
+        distribution=_ReversedBoltzmann(),
+    )
+    assert not pt._boltzmann
+    pt.attempt_swaps(scheme="all")
+    assert pt.states.tolist() == [5.0, 0.0]
+
+
+def test_boltzmann_swap_acceptance_rate():
+    # moving E=5 to the cold replica: log A = (1 - 1/2) (0 - 5) = -2.5
+    pt = ParallelTempering(
+        energy_fn=lambda x: x,
+        local_step_fn=identity_step,
+        temperatures=[1.0, 2.0],
+        init_states=[0.0, 5.0],
+        rng=np.random.default_rng(0),
+    )
+    for _ in range(4000):
+        pt.attempt_swaps(scheme="all")
+        pt.states[:] = [0.0, 5.0]
+        pt.energies[:] = [0.0, 5.0]
+    assert pt.swap_acceptance_rate() == pytest.approx(np.exp(-2.5), abs=0.02)
+
+
+def gaussian_energy(x):
+    return 0.5 * float(np.dot(x, x))
+
+
+def gaussian_exact_step(x, beta, rng):
+    # independent draw from exp(-beta E): exact sampling at each temperature
+    new_x = rng.standard_normal(x.shape) / np.sqrt(beta)
+    return new_x, gaussian_energy(new_x)
+
+
+def test_optimize_ladder_pins_endpoints_and_evens_out_acceptance():
+    pt = ParallelTempering(
+        energy_fn=gaussian_energy,
+        local_step_fn=gaussian_exact_step,
+        temperatures=[1.0, 1.1, 1.2, 1.3, 10.0],
+        init_state=np.zeros(10),
+        rng=np.random.default_rng(1),
+    )
+    pt.run(2000, swap_scheme="all")
+    before = np.array(list(pt.pair_acceptance_rates().values()))
+
+    temps = pt.optimize_ladder(n_calibration_iters=2000, n_rounds=3)
+    assert temps[0] == pytest.approx(1.0)
+    assert temps[-1] == pytest.approx(10.0)
+    assert temps == sorted(temps)
+    assert pt.n_swap_attempts == 0
+
+    pt.run(2000, swap_scheme="all")
+    after = np.array(list(pt.pair_acceptance_rates().values()))
+    assert after.max() - after.min() < 0.5 * (before.max() - before.min())
+    assert after.min() > before.min()
+
+
+def shift_step(x, beta, rng):
+    new_x = x + 1.0
+    return new_x, gaussian_energy(new_x)
+
+
+def test_scalar_float_states_are_handed_out_as_python_floats():
+    seen = []
+
+    def step(x, beta, rng):
+        seen.append((type(x), type(beta)))
+        return x, 0.0
+
+    pt = ParallelTempering(
+        energy_fn=flat_energy,
+        local_step_fn=step,
+        temperatures=[1.0, 2.0],
+        init_state=0.5,
+    )
+    pt.step_local(2)
+    assert set(seen) == {(float, float)}
+    assert all(
+        type(rep.state) is float and type(rep.beta) is float for rep in pt.replicas
+    )
+
+
+@pytest.mark.parametrize("form", ["sampler", "replicas"])
+def test_callback_samples_of_vector_states_are_independent(form):
+    samples = []
+    if form == "sampler":
+        def callback(it, sampler):
+            samples.append(sampler.states[0].copy())
+    else:
+        def callback(it, replicas, sampler):
+            samples.append(replicas[0].state)
+
+    pt = ParallelTempering(
+        energy_fn=gaussian_energy,
+        local_step_fn=shift_step,
+        temperatures=[1.0, 2.0],
+        init_state=np.zeros(2),
+    )
+    pt.run(5, callback=callback)
+    assert [s[0] for s in samples] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert not any(np.shares_memory(s, pt.states) for s in samples)
+
+    pt.replicas[0].state[0] = 999.0
+    assert pt.states[0, 0] == 5.0
+
+
+class _Recorder:
+    def on_iteration(self, it, sampler):
+        pass
+
+
+@pytest.mark.parametrize(
+    "callback, sampler_only",
+    [
+        (lambda it, sampler: None, True),
+        (lambda it, replicas, sampler: None, False),
+        (_Recorder().on_iteration, True),
+        (lambda *args: None, False),
+        # defaulted extras do not count towards the arity ...
+        (lambda it, sampler, label="low-T": None, True),
+        # ... unless the second parameter is named `replicas`
+        (lambda it, replicas, sampler=None: None, False),
+    ],
+    ids=[
+        "two-args", "three-args", "bound-method", "varargs",
+        "defaulted-extra", "defaulted-sampler",
+    ],
+)
+def test_callback_form_is_chosen_by_required_positional_arity(callback, sampler_only):
+    assert _takes_sampler_only(callback) is sampler_only
+
+
+@pytest.mark.parametrize("form", ["sampler", "replicas"])
+def test_callback_form_overrides_signature_inspection(form):
+    calls = []
+
+    def callback(*args):
+        calls.append(args)
+
+    pt = ParallelTempering(
+        energy_fn=flat_energy,
+        local_step_fn=identity_step,
+        temperatures=[1.0, 2.0],
+        init_state=0.0,
+    )
+    pt.run(1, callback=callback, callback_form=form)
+    if form == "sampler":
+        assert calls == [(0, pt)]
+    else:
+        assert len(calls[0]) == 3 and calls[0][2] is pt
+    with pytest.raises(ValueError, match="callback form"):
+        pt.run(1, callback=callback, callback_form="states")
+
+
+@pytest.mark.parametrize("temperatures", [[0.0, 1.0], [1.0, -2.0]])
+def test_non_positive_temperatures_are_rejected(temperatures):
+    with pytest.raises(ValueError, match="positive"):
+        ParallelTempering(
+            energy_fn=flat_energy,
+            local_step_fn=identity_step,
+            temperatures=temperatures,
+            init_state=0.0,
+        )
+
+
+def test_jit_all_scheme_matches_python_sweep_order():
+    pytest.importorskip("numba")
+    pt = ParallelTempering(
+        energy_fn=flat_energy,
+        local_step_fn=identity_step,
+        temperatures=[1.0, 2.0, 3.0, 4.0, 5.0],
+        init_states=[0.0, 1.0, 2.0, 3.0, 4.0],
+        jit=True,
+        jit_step_size=0.0,
+    )
+    pt.run(1, swap_scheme="all")
+    assert pt.states.tolist() == [1.0, 3.0, 0.0, 4.0, 2.0]
+    assert pt.lowT_trace.tolist() == [1.0]
+
+
+def test_jit_with_uncompilable_energy_fn_warns_and_falls_back():
+    pytest.importorskip("numba")
+    with pytest.warns(RuntimeWarning, match="jit=True ignored"):
+        pt = ParallelTempering(
+            energy_fn=gaussian_energy,
+            local_step_fn=identity_step,
+            temperatures=[1.0, 2.0],
+            init_state=0.0,
+            cache_energy=True,
+            jit=True,
+        )
+    pt.run(3)
+    assert pt.lowT_trace is None
+
+
+def test_jit_run_zero_iterations_is_a_no_op():
+    pytest.importorskip("numba")
+    pt = ParallelTempering(
+        energy_fn=flat_energy,
+        local_step_fn=identity_step,
+        temperatures=[1.0, 2.0],
+        init_states=[0.0, 1.0],
+        jit=True,
+    )
+    pt.run(0)
+    assert pt.states.tolist() == [0.0, 1.0]
+    assert pt.n_swap_attempts == 0
+    assert pt.lowT_trace.tolist() == []
+
+
+def test_jit_samplers_share_the_compiled_energy_fn():
+    pytest.importorskip("numba")
+    samplers = [
+        ParallelTempering(
+            energy_fn=flat_energy,
+            local_step_fn=identity_step,
+            temperatures=[1.0, 2.0],
+            init_state=0.0,
+            jit=True,
+        )
+        for _ in range(2)
+    ]
+    assert samplers[0]._jit_energy_fn is samplers[1]._jit_energy_fn
+
+
+def test_jit_energy_fn_cache_does_not_keep_energy_fn_alive():
+    pytest.importorskip("numba")
+    import gc
+    import weakref
+
+    energy_fn = (lambda a: lambda x: a * x * x)(2.0)
+    pt = ParallelTempering(
+        energy_fn=energy_fn,
+        local_step_fn=identity_step,
+        temperatures=[1.0, 2.0],
+        init_state=0.0,
+        jit=True,
+    )
+    pt.run(2)
+    ref = weakref.ref(energy_fn)
+    del pt, energy_fn
+    gc.collect()
+    assert ref() is None
+
+
+def test_jit_ignores_batch_step_fn_and_workers_with_a_warning():
+    pytest.importorskip("numba")
+    with pytest.warns(RuntimeWarning) as record:
+        pt = ParallelTempering(
+            energy_fn=flat_energy,
+            local_step_fn=random_walk_step,
+            batch_step_fn=shift_batch_step,
+            temperatures=[1.0, 2.0],
+            init_state=0.0,
+            n_workers=2,
+            jit=True,
+        )
+    messages = [str(w.message) for w in record]
+    assert any(m.startswith("batch_step_fn ignored") for m in messages)
+    assert any(m.startswith("n_workers ignored") for m in messages)
+    assert pt._pool is None